@@ -0,0 +1,472 @@
+#!/usr/bin/env python3
+"""
+Animated Tkinter GUI for the voice assistant
+Imported only in GUI mode so terminal mode never loads Tcl/Tk
+"""
+
+import tkinter as tk
+import threading
+import queue
+import math
+import time
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+try:
+    from PIL import Image, ImageDraw, ImageTk
+    PIL_AVAILABLE = True
+except ImportError:
+    PIL_AVAILABLE = False
+
+# Per-point trig for the visualizer ring, computed once:
+# (cos a, sin a, sin 5a, cos 5a, sin 3a, cos 3a) for 60 segments, closed
+_RING_POINTS = 60
+_RING_TABLE = tuple(
+    (math.cos(a), math.sin(a), math.sin(5 * a), math.cos(5 * a), math.sin(3 * a), math.cos(3 * a))
+    for a in ((i / _RING_POINTS) * 2 * math.pi for i in range(_RING_POINTS + 1))
+)
+
+# Glow ring state stored column-wise so colors blend in one vectorized step
+_GLOW_RADII = tuple(90 + 70 - i * 12 for i in range(6))
+_HEX2 = tuple(f'{i:02x}' for i in range(256))
+if NUMPY_AVAILABLE:
+    _GLOW_WEIGHTS = 60 - np.arange(6) * 10
+    _GLOW_BG = 10
+    _RGB_CACHE = {}
+
+class VoiceAssistantGUI:
+    """Beautiful animated GUI for the voice assistant"""
+    
+    def __init__(self, root):
+        self.root = root
+        self.root.title("Voice Assistant - وائس اسسٹنٹ")
+        self.root.geometry("900x700")
+        self.root.configure(bg='#0a0a0a')
+        
+        # Animation state
+        self.is_listening = False
+        self.is_speaking = False
+        self.is_processing = False
+        self.animation_running = True
+        self.wave_offset = 0
+        self.glow_intensity = 0
+        self.pulse_phase = 0
+        
+        # Colors
+        self.bg_color = '#0a0a0a'
+        self.accent_color = '#00ff88'
+        self.speaking_color = '#ff0088'
+        self.listening_color = '#0088ff'
+        self.processing_color = '#ffaa00'
+        self.idle_color = '#444444'
+        
+        # Message queue for thread-safe updates
+        self.message_queue = queue.Queue()
+        
+        # Transcript timestamp cache (1s resolution)
+        self._ts_second = None
+        self._ts_str = ''
+        
+        # Transcript lines waiting for the next batched insert
+        self._pending_lines = []
+        
+        self.setup_ui()
+        self.start_animation()
+        self.process_message_queue()
+    
+    def setup_ui(self):
+        """Setup the user interface"""
+        main_frame = tk.Frame(self.root, bg=self.bg_color)
+        main_frame.pack(fill=tk.BOTH, expand=True, padx=20, pady=20)
+        
+        # Title
+        title_label = tk.Label(
+            main_frame,
+            text="AI VOICE ASSISTANT",
+            font=('Arial', 28, 'bold'),
+            bg=self.bg_color,
+            fg=self.accent_color
+        )
+        title_label.pack(pady=(0, 5))
+        
+        # Subtitle
+        subtitle_label = tk.Label(
+            main_frame,
+            text="وائس اسسٹنٹ | Bilingual English + Urdu",
+            font=('Arial', 14),
+            bg=self.bg_color,
+            fg='#888888'
+        )
+        subtitle_label.pack(pady=(0, 20))
+        
+        # Canvas for visualizer
+        self.canvas = tk.Canvas(
+            main_frame,
+            width=450,
+            height=450,
+            bg=self.bg_color,
+            highlightthickness=0
+        )
+        self.canvas.pack(pady=20)
+        self._init_frame_buffer()
+        
+        # Status label
+        self.status_label = tk.Label(
+            main_frame,
+            text="💤 Initializing...",
+            font=('Arial', 16, 'bold'),
+            bg=self.bg_color,
+            fg='#888888'
+        )
+        self.status_label.pack(pady=15)
+        
+        # Transcript area
+        transcript_frame = tk.Frame(main_frame, bg=self.bg_color)
+        transcript_frame.pack(fill=tk.BOTH, expand=True, pady=10)
+        
+        tk.Label(
+            transcript_frame,
+            text="📝 Conversation History:",
+            font=('Arial', 12, 'bold'),
+            bg=self.bg_color,
+            fg='#888888',
+            anchor='w'
+        ).pack(fill=tk.X)
+        
+        # Text widget with scrollbar
+        text_scroll_frame = tk.Frame(transcript_frame, bg=self.bg_color)
+        text_scroll_frame.pack(fill=tk.BOTH, expand=True)
+        
+        self.transcript = tk.Text(
+            text_scroll_frame,
+            height=6,
+            bg='#1a1a1a',
+            fg='#ffffff',
+            font=('Consolas', 10),
+            relief=tk.FLAT,
+            padx=10,
+            pady=10,
+            wrap=tk.WORD
+        )
+        self.transcript.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        
+        scrollbar = tk.Scrollbar(text_scroll_frame, command=self.transcript.yview)
+        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        self.transcript.config(yscrollcommand=scrollbar.set)
+        
+        # Transcript tag colors never change, configure them once
+        self.transcript.tag_config('user', foreground='#00ff88')
+        self.transcript.tag_config('assistant', foreground='#0088ff')
+        self.transcript.tag_config('system', foreground='#888888')
+        
+        # Info footer
+        info_label = tk.Label(
+            main_frame,
+            text="🎤 Say 'alexa' or 'الیکسا' to activate | Press Ctrl+C in terminal to exit",
+            font=('Arial', 9),
+            bg=self.bg_color,
+            fg='#666666'
+        )
+        info_label.pack(side=tk.BOTTOM, pady=(10, 0))
+    
+    def _init_frame_buffer(self):
+        """Create the off-screen frame buffer and the single canvas image showing it"""
+        if not PIL_AVAILABLE:
+            self._buf = None
+            return
+        
+        self._buf = Image.new('RGB', (450, 450), self.bg_color)
+        self._draw = ImageDraw.Draw(self._buf)
+        self._tkimg = ImageTk.PhotoImage(self._buf)
+        self.canvas.create_image(0, 0, anchor='nw', image=self._tkimg)
+        # Emoji icons are left to Tk's font renderer on top of the image
+        self._icon = "💤"
+        self._icon_item = self.canvas.create_text(225, 225, text=self._icon, font=('Arial', 28))
+    
+    def draw_circular_visualizer(self):
+        """Draw animated circular visualizer"""
+        cx, cy = 225, 225
+        base_radius = 90
+        
+        # Determine state and colors
+        if self.is_speaking:
+            color = self.speaking_color
+            glow_target = 1.0
+            wave_amplitude = 50
+            icon = "🗣️"
+        elif self.is_listening:
+            color = self.listening_color
+            glow_target = 0.8
+            wave_amplitude = 30
+            icon = "🎤"
+        elif self.is_processing:
+            color = self.processing_color
+            glow_target = 0.6
+            wave_amplitude = 20
+            icon = "⚙️"
+        else:
+            color = self.idle_color
+            glow_target = 0.2
+            wave_amplitude = 8
+            icon = "💤"
+        
+        # Smooth glow transition
+        self.glow_intensity += (glow_target - self.glow_intensity) * 0.15
+        
+        # Glow rings as (radius, color), outermost first
+        if NUMPY_AVAILABLE:
+            rings = self._glow_rings(color)
+        else:
+            rings = []
+            for i in range(6):
+                glow_radius = base_radius + 70 - i * 12
+                alpha = int(self.glow_intensity * (60 - i * 10))
+                rings.append((glow_radius, self._blend_color(color, alpha)))
+        
+        # Waveform: sin(5a + off) and sin(3a - 0.7off) are expanded with the
+        # angle-addition identities so only the per-frame terms need trig
+        sin_off, cos_off = math.sin(self.wave_offset), math.cos(self.wave_offset)
+        sin_off7, cos_off7 = math.sin(self.wave_offset * 0.7), math.cos(self.wave_offset * 0.7)
+        amp5_sin, amp5_cos = wave_amplitude * cos_off, wave_amplitude * sin_off
+        amp3_sin, amp3_cos = wave_amplitude * 0.4 * cos_off7, -wave_amplitude * 0.4 * sin_off7
+        ring_radius = base_radius + math.sin(self.pulse_phase) * 15 * self.glow_intensity
+        
+        points = []
+        for cos_a, sin_a, sin_5a, cos_5a, sin_3a, cos_3a in _RING_TABLE:
+            radius = (ring_radius
+                      + sin_5a * amp5_sin + cos_5a * amp5_cos
+                      + sin_3a * amp3_sin + cos_3a * amp3_cos)
+            points.append((cx + radius * cos_a, cy + radius * sin_a))
+        
+        if self._buf is not None:
+            self._render_to_buffer(cx, cy, color, rings, points, icon)
+        else:
+            self._render_to_canvas(cx, cy, color, rings, points, icon)
+        
+        self.wave_offset += 0.12
+        self.pulse_phase += 0.06
+    
+    def _render_to_buffer(self, cx, cy, color, rings, points, icon):
+        """Render the frame into the PIL buffer and upload it with one paste"""
+        draw = self._draw
+        draw.rectangle((0, 0, 450, 450), fill=self.bg_color)
+        
+        for glow_radius, glow_color in rings:
+            draw.ellipse(
+                (cx - glow_radius, cy - glow_radius, cx + glow_radius, cy + glow_radius),
+                outline=glow_color,
+                width=2
+            )
+        
+        if len(points) > 1:
+            draw.line(points, fill=color, width=4, joint='curve')
+        
+        # Center circle
+        center_radius = 35
+        draw.ellipse(
+            (cx - center_radius, cy - center_radius, cx + center_radius, cy + center_radius),
+            fill=self.bg_color,
+            outline=color,
+            width=3
+        )
+        
+        self._tkimg.paste(self._buf)
+        
+        if icon != self._icon:
+            self._icon = icon
+            self.canvas.itemconfig(self._icon_item, text=icon)
+    
+    def _render_to_canvas(self, cx, cy, color, rings, points, icon):
+        """Render the frame as Canvas items (fallback when Pillow is missing)"""
+        self.canvas.delete('all')
+        
+        for glow_radius, glow_color in rings:
+            self.canvas.create_oval(
+                cx - glow_radius, cy - glow_radius,
+                cx + glow_radius, cy + glow_radius,
+                outline=glow_color,
+                width=2
+            )
+        
+        if len(points) > 1:
+            self.canvas.create_line(points, fill=color, width=4, smooth=True)
+        
+        # Center circle
+        center_radius = 35
+        self.canvas.create_oval(
+            cx - center_radius, cy - center_radius,
+            cx + center_radius, cy + center_radius,
+            fill=self.bg_color,
+            outline=color,
+            width=3
+        )
+        
+        self.canvas.create_text(cx, cy, text=icon, font=('Arial', 28))
+    
+    def _glow_rings(self, hex_color):
+        """Blend all glow ring colors against the background in one NumPy pass"""
+        rgb = _RGB_CACHE.get(hex_color)
+        if rgb is None:
+            rgb = _RGB_CACHE[hex_color] = np.array(
+                [int(hex_color[1:3], 16), int(hex_color[3:5], 16), int(hex_color[5:7], 16)]
+            )
+        
+        alphas = (self.glow_intensity * _GLOW_WEIGHTS).astype(np.int32)
+        blended = (_GLOW_BG + (rgb - _GLOW_BG) * (alphas[:, None] / 255)).astype(np.int32)
+        
+        return [
+            (radius, ''.join(('#', _HEX2[r], _HEX2[g], _HEX2[b])))
+            for radius, (r, g, b) in zip(_GLOW_RADII, blended.tolist())
+        ]
+    
+    def _blend_color(self, hex_color, alpha):
+        """Blend color with background"""
+        r = int(hex_color[1:3], 16)
+        g = int(hex_color[3:5], 16)
+        b = int(hex_color[5:7], 16)
+        
+        bg = 10
+        r = int(bg + (r - bg) * (alpha / 255))
+        g = int(bg + (g - bg) * (alpha / 255))
+        b = int(bg + (b - bg) * (alpha / 255))
+        
+        return f'#{r:02x}{g:02x}{b:02x}'
+    
+    def start_animation(self):
+        """Start animation loop"""
+        def animate():
+            while self.animation_running:
+                try:
+                    if self.root.winfo_exists():
+                        self.draw_circular_visualizer()
+                        time.sleep(0.033)  # ~30 FPS
+                    else:
+                        break
+                except Exception as e:
+                    # Handle any drawing errors silently
+                    time.sleep(0.1)
+                    continue
+        
+        threading.Thread(target=animate, daemon=True).start()
+    
+    def process_message_queue(self):
+        """Process queued GUI updates"""
+        while True:
+            try:
+                func, args = self.message_queue.get_nowait()
+            except queue.Empty:
+                break
+            try:
+                func(*args)
+            except Exception:
+                # Silently handle GUI update errors
+                pass
+        
+        self._flush_transcript()
+        
+        if self.root.winfo_exists():
+            self.root.after(50, self.process_message_queue)
+    
+    def _flush_transcript(self):
+        """Insert all lines queued during this tick with a single Text.insert"""
+        if not self._pending_lines:
+            return
+        
+        lines, self._pending_lines = self._pending_lines, []
+        
+        # Merge consecutive lines sharing a tag, then pass (chars, tag) pairs in one call
+        chunks = []
+        for line, tag in lines:
+            if chunks and chunks[-1][1] == tag:
+                chunks[-1][0].append(line)
+            else:
+                chunks.append(([line], tag))
+        
+        args = []
+        for parts, tag in chunks:
+            args.append(''.join(parts))
+            args.append(tag)
+        
+        try:
+            self.transcript.insert(tk.END, *args)
+            self.transcript.see(tk.END)
+        except Exception:
+            pass
+    
+    def queue_update(self, func, *args):
+        """Queue a GUI update"""
+        try:
+            if self.root and self.root.winfo_exists():
+                self.message_queue.put((func, args))
+        except:
+            pass
+    
+    def set_listening(self):
+        """Set listening state"""
+        self.is_listening = True
+        self.is_speaking = False
+        self.is_processing = False
+        self.status_label.config(text="🎤 Listening...", fg=self.listening_color)
+    
+    def set_speaking(self, text=""):
+        """Set speaking state"""
+        self.is_listening = False
+        self.is_speaking = True
+        self.is_processing = False
+        display_text = text[:40] + "..." if len(text) > 40 else text
+        self.status_label.config(text=f"🗣️ {display_text}", fg=self.speaking_color)
+    
+    def set_processing(self):
+        """Set processing state"""
+        self.is_listening = False
+        self.is_speaking = False
+        self.is_processing = True
+        self.status_label.config(text="⚙️ Processing...", fg=self.processing_color)
+    
+    def set_idle(self):
+        """Set idle state"""
+        self.is_listening = False
+        self.is_speaking = False
+        self.is_processing = False
+        self.status_label.config(text="💤 Waiting for wake word...", fg='#888888')
+    
+    def _timestamp(self):
+        """Return the current HH:MM:SS string, reformatting at most once per second"""
+        now = int(time.time())
+        if now != self._ts_second:
+            self._ts_second = now
+            self._ts_str = time.strftime("%H:%M:%S", time.localtime(now))
+        return self._ts_str
+    
+    def add_user_message(self, text, lang='en'):
+        """Add user message"""
+        try:
+            prefix = "] 👤 You: " if lang == 'en' else "] 👤 آپ: "
+            line = ''.join(('[', self._timestamp(), prefix, text, '\n'))
+            self._pending_lines.append((line, 'user'))
+        except:
+            pass
+    
+    def add_assistant_message(self, text, lang='en'):
+        """Add assistant message"""
+        try:
+            line = ''.join(('[', self._timestamp(), '] 🤖 Assistant: ', text, '\n'))
+            self._pending_lines.append((line, 'assistant'))
+        except:
+            pass
+    
+    def add_system_message(self, text):
+        """Add system message"""
+        try:
+            line = ''.join(('[', self._timestamp(), '] ℹ️  ', text, '\n'))
+            self._pending_lines.append((line, 'system'))
+        except:
+            pass
+    
+    def cleanup(self):
+        """Cleanup"""
+        self.animation_running = False
@@ -71,7 +71,7 @@ class BrowserTabManager:
     def get_chrome_tabs(self) -> List[Dict[str, str]]:
         """
         Get list of open Chrome/Chromium tabs
-        Returns: list of {title, window_id, browser}
+        Returns: list of {title, title_lower, window_id, browser}
         """
         if not self.wmctrl_available:
             logger.debug("wmctrl not available, cannot get Chrome tabs")
@@ -104,8 +104,10 @@ class BrowserTabManager:
                         title = title.replace(' - Google Chrome', '')
                         title = title.replace(' - Chromium', '')
                         
+                        title = title.strip()
                         tabs.append({
-                            'title': title.strip(),
+                            'title': title,
+                            'title_lower': title.lower(),  # For keyword matching
                             'window_id': window_id,
                             'browser': 'chrome'
                         })
@@ -118,7 +120,7 @@ class BrowserTabManager:
     def get_firefox_tabs(self) -> List[Dict[str, str]]:
         """
         Get list of open Firefox tabs
-        Returns: list of {title, window_id, browser}
+        Returns: list of {title, title_lower, window_id, browser}
         """
         if not self.wmctrl_available:
             logger.debug("wmctrl not available, cannot get Firefox tabs")
@@ -151,8 +153,10 @@ class BrowserTabManager:
                         title = title.replace(' - Mozilla Firefox', '')
                         title = title.replace(' — Mozilla Firefox', '')
                         
+                        title = title.strip()
                         tabs.append({
-                            'title': title.strip(),
+                            'title': title,
+                            'title_lower': title.lower(),  # For keyword matching
                             'window_id': window_id,
                             'browser': 'firefox'
                         })
@@ -189,7 +193,7 @@ class BrowserTabManager:
         patterns = self.website_patterns.get(website_name, [website_name])
         
         for tab in all_tabs:
-            title_lower = tab['title'].lower()
+            title_lower = tab['title_lower']
             
             # Check if any pattern matches
             for pattern in patterns:
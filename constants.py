@@ -57,15 +57,32 @@ SUBPROCESS_LONG_TIMEOUT = 10
 PROCESS_TERMINATE_TIMEOUT = 3
 PROCESS_KILL_DELAY = 0.5
 
+COMPONENT_INIT_TIMEOUT = 10  # Max wait for background-initialized components
+
 DEFAULT_LISTEN_TIMEOUT = 5
 DEFAULT_PHRASE_TIME_LIMIT = 5
 DEFAULT_PAUSE_THRESHOLD = 0.5
 DEFAULT_NOISE_ADJUSTMENT = 0.5
 
-INTERNET_CHECK_TIMEOUT = 3
+INTERNET_CHECK_TIMEOUT = 1.5  # Also the longest the first is_connected() can block
 INTERNET_CHECK_CACHE_DURATION = 30
 TTS_CACHE_DURATION_DAYS = 7
 
+# Maximum number of speak() requests waiting on the TTS engine at once
+TTS_CONCURRENT_REQUESTS = 3
+
+# Short replies spoken constantly; synthesized once at startup and replayed
+TTS_CANNED_PROMPTS = (
+    ('Yes?', 'en'),
+    ('جی؟', 'ur'),
+    ('Goodbye! Have a great day!', 'en'),
+    ('خدا حافظ! اچھا دن گزرے!', 'ur'),
+    ('Sorry, an error occurred', 'en'),
+    ('معذرت، ایک خرابی ہوئی', 'ur'),
+    ("I'm not sure how to do that yet", 'en'),
+    ('مجھے ابھی یہ کرنا نہیں آتا', 'ur'),
+)
+
 # ============================================================================
 # APPLICATION MAPPINGS
 # ============================================================================
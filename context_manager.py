@@ -203,7 +203,7 @@ class ContextManager:
         return False
     
     def get_chrome_profile_command(self, profile_name):
-        """Get Chrome command with specific profile"""
+        """Get Chrome argv list with specific profile"""
         # Map common profile names
         profiles = {
             'me': 'Default',
@@ -217,7 +217,7 @@ class ContextManager:
         }
         
         profile_dir = profiles.get(profile_name.lower(), 'Default')
-        return f'google-chrome --profile-directory="{profile_dir}"'
+        return ['google-chrome', f'--profile-directory={profile_dir}']
     
     def open_url_in_browser(self, url):
         """Open URL in last opened browser"""
@@ -4,6 +4,8 @@ Provides consistent error handling and safe operation wrappers
 """
 
 import logging
+import functools
+import shutil
 import subprocess
 from typing import Tuple
 
@@ -115,16 +117,10 @@ def safe_file_write(filepath: str, content: str) -> bool:
 # DEPENDENCY CHECKING
 # ============================================================================
 
+@functools.lru_cache(maxsize=256)
 def check_command_exists(command: str) -> bool:
-    """Check if a command exists in system PATH"""
-    try:
-        subprocess.run(['which', command], 
-                      capture_output=True, 
-                      check=True, 
-                      timeout=2)
-        return True
-    except:
-        return False
+    """Check if a command exists in system PATH (cached per command)"""
+    return shutil.which(command) is not None
 
 # ============================================================================
 # INPUT SANITIZATION
@@ -5,10 +5,13 @@ Multimedia Actions - Control music, videos, and media playback
 import subprocess
 import os
 import glob
+import re
 import logging
 
 logger = logging.getLogger(__name__)
 
+_AMIXER_PERCENT_RE = re.compile(r'\[(\d+)%\]')
+
 class MultimediaActions:
     def __init__(self, config):
         self.config = config
@@ -161,8 +164,7 @@ class MultimediaActions:
             ).decode()
             
             # Parse volume percentage
-            import re
-            match = re.search(r'\[(\d+)%\]', result)
+            match = _AMIXER_PERCENT_RE.search(result)
             if match:
                 volume = match.group(1)
                 return True, f"Volume is at {volume}%"
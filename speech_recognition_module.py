@@ -3,18 +3,48 @@ Speech Recognition module with wake word detection
 """
 
 import speech_recognition as sr
+import os
 import re
+import functools
+import struct
+import threading
 import logging
 
 try:
-    from langdetect import detect, DetectorFactory
+    from langdetect.detector_factory import DetectorFactory, PROFILES_DIRECTORY
     DetectorFactory.seed = 0
     LANGDETECT_AVAILABLE = True
 except ImportError:
     LANGDETECT_AVAILABLE = False
 
+try:
+    import pvporcupine
+    import pyaudio
+    PORCUPINE_AVAILABLE = True
+except ImportError:
+    PORCUPINE_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
+# Urdu is written in Arabic script, so one character from that block settles it
+_URDU_RE = re.compile(r'[\u0600-\u06FF]')
+
+# langdetect's stock factory loads all 55 language profiles; we only answer in two
+_DETECT_PROFILES = ('en', 'ur')
+
+
+@functools.lru_cache(maxsize=1)
+def _detector_factory():
+    """Build a langdetect factory holding only the English and Urdu profiles"""
+    profiles = []
+    for lang in _DETECT_PROFILES:
+        with open(os.path.join(PROFILES_DIRECTORY, lang), encoding='utf-8') as f:
+            profiles.append(f.read())
+    factory = DetectorFactory()
+    factory.load_json_profile(profiles)
+    return factory
+
+
 class SpeechRecognizer:
     def __init__(self, config):
         self.config = config
@@ -32,21 +62,20 @@ class SpeechRecognizer:
         self.wake_word_en = config.get('General', 'wake_word', fallback='alexa').lower()
         self.wake_word_ur = config.get('General', 'wake_word_ur', fallback='الیکسا')
         self.wake_word_enabled = config.getboolean('Features', 'enable_wake_word', fallback=True)
+        self.porcupine_access_key = config.get('Features', 'porcupine_access_key', fallback='')
     
     def detect_language(self, text):
         """Detect if text is in English or Urdu"""
-        if not LANGDETECT_AVAILABLE:
-            # Fallback: check for Urdu Unicode range
-            urdu_pattern = re.compile(r'[\u0600-\u06FF]+')
-            if urdu_pattern.search(text):
-                return 'ur'
+        if _URDU_RE.search(text):
+            return 'ur'
+        # Plain ASCII can't be Urdu script; only odd non-ASCII text needs langdetect
+        if text.isascii() or not LANGDETECT_AVAILABLE:
             return 'en'
         
         try:
-            lang = detect(text)
-            if lang in ['ur', 'pa', 'hi']:
-                return 'ur'
-            return 'en'
+            detector = _detector_factory().create()
+            detector.append(text)
+            return 'ur' if detector.detect() == 'ur' else 'en'
         except:
             return 'en'
     
@@ -177,6 +206,58 @@ class SpeechRecognizer:
         """Listen specifically for wake word"""
         return self.listen(wait_for_wake_word=True)
     
+    def start_wake_engine(self, wake_queue):
+        """
+        Spot the wake word on-device with Porcupine in a background thread.
+        Puts True on wake_queue for every detection.
+        Returns False if Porcupine is unavailable, so callers keep polling.
+        """
+        if not (PORCUPINE_AVAILABLE and self.wake_word_enabled and self.porcupine_access_key):
+            return False
+        if self.wake_word_en not in pvporcupine.KEYWORDS:
+            logger.warning(f"Porcupine has no built-in keyword '{self.wake_word_en}'")
+            return False
+        
+        try:
+            porcupine = pvporcupine.create(
+                access_key=self.porcupine_access_key,
+                keywords=[self.wake_word_en]
+            )
+        except Exception as e:
+            logger.warning(f"Porcupine init failed, using speech wake word: {e}")
+            return False
+        
+        threading.Thread(
+            target=self._wake_engine_loop, args=(porcupine, wake_queue), daemon=True
+        ).start()
+        logger.info(f"Porcupine wake engine listening for '{self.wake_word_en}'")
+        return True
+    
+    def _wake_engine_loop(self, porcupine, wake_queue):
+        """Read microphone frames and feed them to Porcupine"""
+        pa = pyaudio.PyAudio()
+        stream = None
+        frame_format = f'{porcupine.frame_length}h'
+        try:
+            stream = pa.open(
+                rate=porcupine.sample_rate,
+                channels=1,
+                format=pyaudio.paInt16,
+                input=True,
+                frames_per_buffer=porcupine.frame_length
+            )
+            while True:
+                pcm = stream.read(porcupine.frame_length, exception_on_overflow=False)
+                if porcupine.process(struct.unpack_from(frame_format, pcm)) >= 0:
+                    wake_queue.put(True)
+        except Exception as e:
+            logger.error(f"Wake engine stopped: {e}")
+        finally:
+            if stream is not None:
+                stream.close()
+            pa.terminate()
+            porcupine.delete()
+    
     def calibrate_microphone(self):
         """Calibrate microphone for better recognition"""
         with sr.Microphone() as source:
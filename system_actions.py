@@ -4,10 +4,13 @@ System Actions - Control system features like brightness, WiFi, power, etc.
 
 import subprocess
 import os
+import re
 import logging
 
 logger = logging.getLogger(__name__)
 
+_PERCENT_RE = re.compile(r'(\d+)%?')
+
 class SystemActions:
     def __init__(self, config):
         self.config = config
@@ -49,8 +52,7 @@ class SystemActions:
                 return True, "Brightness set to minimum"
             else:
                 # Try to extract percentage
-                import re
-                match = re.search(r'(\d+)%?', action)
+                match = _PERCENT_RE.search(action)
                 if match:
                     percentage = match.group(1)
                     subprocess.run(['brightnessctl', 'set', f'{percentage}%'], check=True)
@@ -0,0 +1,285 @@
+#!/usr/bin/env python3
+"""
+Command Dispatch Regression Test
+Replays a fixed corpus of spoken commands through VoiceAssistant.process_command
+with every side effect mocked out, and compares which handler answered, what
+was said and what was launched against tests/command_dispatch_expected.json.
+
+Run from the project root:
+  python3 tests/test_command_dispatch.py            # check
+  python3 tests/test_command_dispatch.py --update   # re-record after an intended change
+"""
+
+import sys
+import os
+import re
+import json
+import queue
+import logging
+import configparser
+import concurrent.futures
+from unittest import mock
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+EXPECTED_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'command_dispatch_expected.json')
+
+COMMANDS = [
+    # Owner / greetings
+    "what is my name", "who is your owner", "میرا نام کیا ہے",
+    "hello there", "hi", "good morning assistant", "السلام علیکم",
+    # Desktop apps
+    "what apps are running", "what programs are open",
+    "how many chrome windows", "how many windows", "how many tabs", "how many things",
+    # Chrome / profiles
+    "open chrome", "open chrome with profile 1", "open chrome amaan", "open chrome work",
+    "open chrome default profile", "کروم کھولو",
+    "profile 1", "profile 2", "profile 7", "profile",
+    # Search / websites
+    "search for python tutorials", "search python for me", "search for",
+    "youtube", "open youtube", "open gmail please", "go to github", "reddit", "netflix time",
+    "go to www.example.com", "navigate to google", "go to facebook", "open foo.com",
+    "google cats", "search", "تلاش کرو",
+    # Apps
+    "open firefox", "open the terminal", "open calculator", "open stackoverflow",
+    "open it", "close it", "close firefox", "بند کرو",
+    # Exit
+    "exit", "quit now", "goodbye", "stop alexa", "turn off", "turn off wifi",
+    "turn off bluetooth", "خدا حافظ",
+    # Tabs
+    "what tabs are open", "list tabs", "switch to youtube", "switch to somewhere",
+    "close tab", "close youtube", "is youtube open", "is github open", "tab count",
+    # Time / system
+    "what time is it", "وقت کیا ہے", "what is the date",
+    "brightness up", "set brightness to 50", "wifi status", "bluetooth on",
+    "battery level", "disk space", "memory usage", "how much ram", "lock screen",
+    "shutdown the computer", "restart",
+    # Media
+    "play", "play pause", "pause", "stop music", "next song", "skip",
+    "previous track", "go back", "what song is playing", "play music", "موسیقی چلاؤ",
+    "volume 50", "volume 50%", "what volume", "volume up", "screenshot",
+    # Help / unknown
+    "help", "what can you do", "مدد", "blah blah", "something random", "the weather today",
+]
+
+# name -> (workflow state name or None for no workflow, tab manager, app detector, last app)
+SCENARIOS = {
+    'bare': (None, False, False, None),
+    'idle': ('IDLE', True, True, None),
+    'profile_selection': ('PROFILE_SELECTION', True, True, None),
+    'browser_ready': ('BROWSER_READY', True, True, 'chrome'),
+}
+
+# Clock-dependent replies
+_CLOCK_RE = re.compile(
+    r'\d\d:\d\d [AP]M|\w+day, \w+ \d\d, \d{4}|\w+day ہے، تاریخ \w+ \d\d, \d{4}'
+    r'|(?:صبح|دوپہر|شام) بخیر|Good (?:morning|afternoon|evening)'
+)
+
+# Mock reprs carry a per-run object id
+_MOCK_ID_RE = re.compile(r" id='\d+'")
+
+_URDU_RE = re.compile('[\u0600-\u06ff]')
+
+
+class _SyncPool:
+    """Stand-in for the launcher pool that runs submissions inline"""
+    
+    def submit(self, fn, *args, **kwargs):
+        future = concurrent.futures.Future()
+        try:
+            future.set_result(fn(*args, **kwargs))
+        except Exception as e:
+            future.set_exception(e)
+        return future
+
+
+def make_assistant(va, scenario):
+    """A VoiceAssistant with every collaborator replaced by a recording mock"""
+    from context_manager import ContextManager
+    
+    state, has_tabs, has_detector, last_app = SCENARIOS[scenario]
+    rec = mock.MagicMock()
+    
+    a = va.VoiceAssistant.__new__(va.VoiceAssistant)
+    config = configparser.ConfigParser()
+    config.read('config.ini')
+    a.config = config
+    a.logger = logging.getLogger('test_command_dispatch')
+    a.gui = None
+    a.speak = rec.speak
+    a.speak_async = rec.speak_async
+    a.tts = rec.tts
+    a.running = True
+    a._confirm_shutdown = config.getboolean('System', 'confirm_shutdown', fallback=True)
+    a._wake_word_enabled = True
+    a._wake_word = 'alexa'
+    a.history = None
+    a.tts_cache = None
+    
+    # Real reference resolution, recorded side effects
+    context = ContextManager()
+    context.last_app_mentioned = last_app
+    for name in ['close_app', 'open_url_in_browser', 'track_opened_app',
+                 'add_to_history', 'get_chrome_profile_command']:
+        setattr(context, name, getattr(rec.context, name))
+    rec.context.close_app.return_value = (True, 'closed')
+    rec.context.open_url_in_browser.return_value = (True, 'opening url')
+    rec.context.get_chrome_profile_command.side_effect = (
+        lambda p: ['google-chrome', '--profile-directory=Profile 1']
+    )
+    a.context = context
+    
+    rec.popen.return_value.pid = 4242
+    
+    a.speech_recognizer = rec.sr
+    rec.sr.detect_language.side_effect = lambda t: 'ur' if _URDU_RE.search(t) else 'en'
+    
+    a.system_actions = rec.sys
+    for name in ['control_brightness', 'control_wifi', 'control_bluetooth', 'get_battery_info',
+                 'get_disk_space', 'get_memory_info', 'lock_screen', 'power_action']:
+        getattr(rec.sys, name).return_value = (True, name)
+    a.multimedia_actions = rec.mm
+    for name in ['play_pause', 'play', 'pause', 'stop', 'next_track', 'previous_track',
+                 'get_current_track', 'play_music_from_directory', 'control_volume_percentage',
+                 'get_volume', 'take_screenshot']:
+        getattr(rec.mm, name).return_value = (True, name)
+    
+    a.tab_manager = rec.tabs if has_tabs else None
+    rec.tabs.find_tab_by_website.side_effect = lambda s: {'title': s} if s in ('youtube', 'github') else None
+    rec.tabs.switch_to_tab.return_value = (True, 'switched')
+    rec.tabs.close_tab.return_value = (True, 'closed tab')
+    rec.tabs.is_website_open.side_effect = lambda s: s == 'youtube'
+    rec.tabs.get_tab_count.return_value = 3
+    rec.tabs.get_all_tabs.return_value = [{'title': 'YouTube'}, {'title': 'GitHub'}]
+    
+    a.app_detector = rec.det if has_detector else None
+    rec.det.get_app_summary.return_value = 'summary'
+    rec.det.get_all_windows.return_value = [1, 2]
+    rec.det.count_app_instances.return_value = 2
+    
+    if state is None:
+        a.workflow = None
+    else:
+        a.workflow = rec.wf
+        rec.wf.state = getattr(va.WorkflowState, state)
+        for name in ['handle_profile_selection', 'handle_browser_opening',
+                     'handle_search_query', 'handle_website_opening']:
+            getattr(rec.wf, name).return_value = (True, name)
+        rec.wf.get_help_message.return_value = 'workflow help'
+    
+    a._components_ready = mock.MagicMock()
+    a._launcher = _SyncPool()
+    a._launched = queue.SimpleQueue()
+    a._build_dispatch_table()
+    return a, rec
+
+
+def run_case(va, command, scenario):
+    """Dispatch one command and describe what happened"""
+    a, rec = make_assistant(va, scenario)
+    lang = 'ur' if _URDU_RE.search(command) else 'en'
+    
+    # Note which handler accepted the command
+    answered = []
+    def recording(name, handler):
+        def wrapper(*args):
+            result = handler(*args)
+            if result is not None:
+                answered.append(name)
+            return result
+        return wrapper
+    a._dispatch_handlers = tuple(
+        recording(name, handler)
+        for (_, _, name), handler in zip(va._DISPATCH_RULES, a._dispatch_handlers)
+    )
+    
+    patches = [
+        mock.patch.object(va, 'webbrowser', rec.webbrowser),
+        mock.patch.object(va, 'command_exists', lambda c: c != 'code'),
+        mock.patch.object(va.subprocess, 'Popen', rec.popen),
+        mock.patch.object(va.shutil, 'which', lambda c: f'/usr/bin/{c}'),
+    ]
+    for p in patches:
+        p.start()
+    try:
+        result = va.VoiceAssistant.process_command(a, command, lang)
+        a._apply_launches()
+    finally:
+        for p in patches:
+            p.stop()
+    
+    calls = []
+    for name, args, kwargs in rec.mock_calls:
+        if name.startswith('sr.detect_language') or name.endswith('__bool__'):
+            continue
+        text = f"{name}{tuple(args)!r}"
+        if kwargs:
+            text += f" {sorted(kwargs.items())!r}"
+        calls.append(_MOCK_ID_RE.sub('', _CLOCK_RE.sub('<clock>', text)))
+    
+    return {
+        'handler': answered[0] if answered else None,
+        'result': result,
+        'running': a.running,
+        'calls': calls,
+    }
+
+
+def run_all(va):
+    return {
+        f"{scenario} | {command}": run_case(va, command, scenario)
+        for scenario in SCENARIOS
+        for command in COMMANDS
+    }
+
+
+print("=" * 60)
+print("🧪 Testing Command Dispatch")
+print("=" * 60)
+
+logging.disable(logging.CRITICAL)
+
+print("\n1️⃣  Importing voice_assistant_advanced...")
+try:
+    import voice_assistant_advanced as va
+    print("   ✅ voice_assistant_advanced")
+except Exception as e:
+    print(f"   ❌ voice_assistant_advanced: {e}")
+    sys.exit(1)
+
+print(f"\n2️⃣  Dispatching {len(COMMANDS)} commands x {len(SCENARIOS)} scenarios...")
+actual = run_all(va)
+print(f"   ✅ {len(actual)} cases ran")
+
+if '--update' in sys.argv:
+    with open(EXPECTED_FILE, 'w', encoding='utf-8') as f:
+        json.dump(actual, f, ensure_ascii=False, indent=1, sort_keys=True)
+        f.write('\n')
+    print(f"\n✅ Recorded {len(actual)} cases to {os.path.relpath(EXPECTED_FILE)}")
+    sys.exit(0)
+
+print("\n3️⃣  Comparing with recorded results...")
+try:
+    with open(EXPECTED_FILE, encoding='utf-8') as f:
+        expected = json.load(f)
+except FileNotFoundError:
+    print(f"   ❌ {EXPECTED_FILE} missing - run with --update to record it")
+    sys.exit(1)
+
+failures = [key for key in sorted(set(expected) | set(actual)) if expected.get(key) != actual.get(key)]
+for key in failures[:10]:
+    print(f"   ❌ {key}")
+    print(f"      expected: {expected.get(key)}")
+    print(f"      actual:   {actual.get(key)}")
+if len(failures) > 10:
+    print(f"   ... and {len(failures) - 10} more")
+
+print("\n" + "=" * 60)
+if failures:
+    print(f"❌ {len(failures)} of {len(actual)} cases changed")
+    print("   If the change is intended, re-record with --update")
+    print("=" * 60)
+    sys.exit(1)
+print(f"✅ All {len(actual)} dispatch cases match!")
+print("=" * 60)
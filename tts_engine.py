@@ -5,10 +5,13 @@ Text-to-Speech Engine with threading and caching support
 import subprocess
 import tempfile
 import os
+import hashlib
 import threading
 from queue import Queue
 import logging
 
+from constants import TTS_CANNED_PROMPTS, DEFAULT_PIPER_MODEL, DEFAULT_TTS_CACHE_DIR
+
 try:
     from gtts import gTTS
     GTTS_AVAILABLE = True
@@ -26,10 +29,22 @@ class TTSEngine:
         self.tts_queue = Queue()
         self.is_speaking = False
         self.stop_speaking = threading.Event()
+        self._player = None  # Audio subprocess currently playing, if any
+        self._player_lock = threading.Lock()  # Orders _play's start against cancel()
+        
+        # Canned prompts: Piper WAVs kept on disk, gTTS ones warmed into tts_cache
+        self._canned = frozenset(TTS_CANNED_PROMPTS)
+        self.canned_dir = os.path.join(
+            os.path.expanduser(config.get('Paths', 'cache_dir', fallback=DEFAULT_TTS_CACHE_DIR)),
+            'canned'
+        )
         
         # Start TTS worker thread
         self.worker_thread = threading.Thread(target=self._tts_worker, daemon=True)
         self.worker_thread.start()
+        
+        # Synthesize canned prompts in the background
+        threading.Thread(target=self._warm_canned_prompts, daemon=True).start()
     
     def _check_piper(self):
         """Check if Piper TTS is installed"""
@@ -41,6 +56,99 @@ class TTSEngine:
         except (FileNotFoundError, subprocess.TimeoutExpired):
             return False
     
+    def _play(self, cmd, **kwargs):
+        """Play audio through an external player that cancel() can terminate"""
+        # cancel() sets stop_speaking before taking the lock, so either we see
+        # the flag here or cancel() sees the player we register
+        with self._player_lock:
+            if self.stop_speaking.is_set():
+                return
+            process = subprocess.Popen(cmd, **kwargs)
+            self._player = process
+        
+        try:
+            returncode = process.wait()
+        finally:
+            self._player = None
+        
+        # A player killed by cancel() is not a failure worth falling back from
+        if returncode != 0 and not self.stop_speaking.is_set():
+            raise subprocess.CalledProcessError(returncode, cmd)
+    
+    def _piper_model(self):
+        """Path of the configured Piper voice model"""
+        return os.path.expanduser(
+            self.config.get('Paths', 'piper_model', fallback=DEFAULT_PIPER_MODEL)
+        )
+    
+    def _synth_piper(self, text, voice_model, out_dir=None):
+        """Render text to a temporary WAV (in out_dir if given) with Piper and return its path"""
+        with tempfile.NamedTemporaryFile(delete=False, suffix='.wav', dir=out_dir) as fp:
+            temp_file = fp.name
+        
+        try:
+            process = subprocess.Popen(
+                ['piper', '--model', voice_model, '--output_file', temp_file],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE
+            )
+            _, stderr = process.communicate(input=text.encode())
+            
+            # Never hand back a failed or empty render
+            if process.returncode != 0:
+                raise subprocess.CalledProcessError(process.returncode, process.args, stderr=stderr)
+            if os.path.getsize(temp_file) == 0:
+                raise RuntimeError("Piper produced an empty WAV")
+        except Exception:
+            try:
+                os.unlink(temp_file)
+            except FileNotFoundError:
+                pass
+            raise
+        return temp_file
+    
+    def _canned_path(self, text, lang):
+        """WAV path for a canned prompt, or None if text is not one"""
+        if (text, lang) not in self._canned:
+            return None
+        text_hash = hashlib.blake2b(f"{text}_{lang}".encode(), digest_size=16).hexdigest()
+        return os.path.join(self.canned_dir, f"{text_hash}.wav")
+    
+    def _warm_canned_prompts(self):
+        """Pre-synthesize canned prompts so they play without TTS latency"""
+        try:
+            os.makedirs(self.canned_dir, exist_ok=True)
+            
+            # Piper (offline, English)
+            voice_model = self._piper_model()
+            if os.path.exists(voice_model) and self._check_piper():
+                for text, lang in TTS_CANNED_PROMPTS:
+                    canned_file = self._canned_path(text, lang)
+                    if lang == 'en' and not os.path.exists(canned_file):
+                        try:
+                            # Render beside the target so the rename is atomic
+                            os.replace(self._synth_piper(text, voice_model, self.canned_dir), canned_file)
+                        except (subprocess.CalledProcessError, RuntimeError, OSError) as e:
+                            logger.warning(f"Could not pre-synthesize '{text}': {e}")
+            
+            # gTTS (online, both languages) via the regular TTS cache
+            if GTTS_AVAILABLE and self.tts_cache and self.internet_checker.is_connected():
+                for text, lang in TTS_CANNED_PROMPTS:
+                    if self.tts_cache.exists(text, lang):
+                        continue
+                    with tempfile.NamedTemporaryFile(delete=False, suffix='.mp3') as fp:
+                        temp_file = fp.name
+                    try:
+                        gTTS(text=text, lang=lang, slow=False).save(temp_file)
+                        self.tts_cache.save(text, temp_file, lang)
+                    finally:
+                        os.unlink(temp_file)
+            
+            logger.info("Canned TTS prompts ready")
+        except Exception as e:
+            logger.warning(f"Could not pre-synthesize canned prompts: {e}")
+    
     def _speak_with_gtts(self, text, lang='en'):
         """Speak using Google TTS (online)"""
         try:
@@ -51,12 +159,12 @@ class TTSEngine:
                     logger.debug(f"Using cached TTS for: {text[:30]}...")
                     # Try multiple audio backends
                     try:
-                        subprocess.run(['mpg123', '-q', cached_file], check=True)
+                        self._play(['mpg123', '-q', cached_file])
                     except:
                         try:
-                            subprocess.run(['ffplay', '-nodisp', '-autoexit', cached_file], check=True, stderr=subprocess.DEVNULL)
+                            self._play(['ffplay', '-nodisp', '-autoexit', cached_file], stderr=subprocess.DEVNULL)
                         except:
-                            subprocess.run(['paplay', cached_file], check=True)
+                            self._play(['paplay', cached_file])
                     return True
             
             # Create temporary file
@@ -72,7 +180,7 @@ class TTSEngine:
                 self.tts_cache.save(text, temp_file, lang)
             
             # Play the audio
-            subprocess.run(['mpg123', '-q', temp_file], check=True)
+            self._play(['mpg123', '-q', temp_file])
             
             # Clean up (cache keeps its copy)
             os.unlink(temp_file)
@@ -88,30 +196,23 @@ class TTSEngine:
             return False
         
         try:
-            voice_model = os.path.expanduser(
-                self.config.get('Paths', 'piper_model', 
-                               fallback='~/.local/share/piper/voices/en_US-lessac-medium.onnx')
-            )
+            # Canned prompts replay their pre-rendered WAV
+            canned_file = self._canned_path(text, lang)
+            if canned_file and os.path.exists(canned_file):
+                self._play(['aplay', '-q', canned_file])
+                return True
+            
+            voice_model = self._piper_model()
             
             if not os.path.exists(voice_model):
                 logger.error(f"Piper model not found: {voice_model}")
                 return False
             
-            # Create temporary WAV file
-            with tempfile.NamedTemporaryFile(delete=False, suffix='.wav') as fp:
-                temp_file = fp.name
-            
             # Generate speech
-            process = subprocess.Popen(
-                ['piper', '--model', voice_model, '--output_file', temp_file],
-                stdin=subprocess.PIPE,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE
-            )
-            process.communicate(input=text.encode())
+            temp_file = self._synth_piper(text, voice_model)
             
             # Play the audio
-            subprocess.run(['aplay', '-q', temp_file], check=True)
+            self._play(['aplay', '-q', temp_file])
             
             # Clean up
             os.unlink(temp_file)
@@ -126,6 +227,8 @@ class TTSEngine:
             item = self.tts_queue.get()
             
             if item is None:  # Shutdown signal
+                # Mark it done too, or anyone in tts_queue.join() waits forever
+                self.tts_queue.task_done()
                 break
             
             text, lang = item
@@ -178,6 +281,17 @@ class TTSEngine:
             except:
                 pass
     
+    def cancel(self):
+        """Drop queued speech and stop the utterance that is playing right now"""
+        self.stop()
+        with self._player_lock:
+            player = self._player
+        if player is not None:
+            try:
+                player.terminate()
+            except OSError:
+                pass
+    
     def shutdown(self):
         """Shutdown TTS engine"""
         self.tts_queue.put(None)
@@ -3,12 +3,21 @@ Utility functions for the bilingual voice assistant
 """
 
 import socket
-import subprocess
 import os
+import hashlib
+import shutil
+import time
+import threading
+import concurrent.futures
+import functools
 import logging
-from datetime import datetime, timedelta
+from collections import deque
+from itertools import islice
+from datetime import datetime
 import configparser
 
+from constants import INTERNET_CHECK_TIMEOUT, INTERNET_CHECK_CACHE_DURATION
+
 logger = logging.getLogger(__name__)
 
 # ============================================================================
@@ -106,28 +115,50 @@ def load_config(config_path='config.ini'):
 # ============================================================================
 
 class InternetChecker:
-    """Check internet connectivity with caching"""
+    """Check internet connectivity with caching, probing in the background"""
     
-    def __init__(self, cache_duration=30):
+    def __init__(self, cache_duration=INTERNET_CHECK_CACHE_DURATION, probe_timeout=INTERNET_CHECK_TIMEOUT):
         self.cache_duration = cache_duration
+        self.probe_timeout = probe_timeout
         self.last_check = None
         self.last_result = False
-    
-    def is_connected(self):
-        """Check internet connectivity with caching"""
-        now = datetime.now()
-        
-        if self.last_check and (now - self.last_check).seconds < self.cache_duration:
-            return self.last_result
         
+        self._lock = threading.Lock()
+        self._executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix='net-probe'
+        )
+        # Start probing right away so the first is_connected() rarely waits
+        self._probe_future = self._executor.submit(self._probe)
+    
+    def _probe(self):
+        """Try a TCP connection to a public DNS server"""
         try:
-            socket.create_connection(("8.8.8.8", 53), timeout=3)
-            self.last_result = True
+            with socket.create_connection(("8.8.8.8", 53), timeout=self.probe_timeout):
+                return True
         except OSError:
-            self.last_result = False
+            return False
+    
+    def is_connected(self):
+        """
+        Check internet connectivity with caching
         
-        self.last_check = now
-        return self.last_result
+        Only the very first call can block: it waits for the probe started in
+        __init__, i.e. at most probe_timeout from construction (less if it was
+        created earlier). After that a stale cache is returned while a fresh
+        probe runs, so later calls never wait on the network.
+        """
+        with self._lock:
+            future = self._probe_future
+            if future is not None and (future.done() or self.last_check is None):
+                self.last_result = future.result()
+                self.last_check = time.monotonic()
+                self._probe_future = None
+            
+            if (self._probe_future is None
+                    and time.monotonic() - self.last_check >= self.cache_duration):
+                self._probe_future = self._executor.submit(self._probe)
+            
+            return self.last_result
 
 # ============================================================================
 # CONVERSATION HISTORY
@@ -136,9 +167,11 @@ class InternetChecker:
 class ConversationHistory:
     """Manage conversation history"""
     
+    __slots__ = ('max_items', 'history')
+    
     def __init__(self, max_items=10):
         self.max_items = max_items
-        self.history = []
+        self.history = deque(maxlen=max_items)  # Oldest entries fall off the left
     
     def add(self, user_input, assistant_response, language='en'):
         """Add a conversation entry"""
@@ -150,93 +183,164 @@ class ConversationHistory:
         }
         
         self.history.append(entry)
-        
-        if len(self.history) > self.max_items:
-            self.history.pop(0)
     
     def get_recent(self, n=5):
         """Get n most recent entries"""
-        return self.history[-n:]
+        size = len(self.history)
+        if 0 < n < size:
+            # Skip the older entries instead of copying the whole deque
+            return list(islice(self.history, size - n, None))
+        return list(self.history)
     
     def clear(self):
         """Clear history"""
-        self.history = []
+        self.history.clear()
 
 # ============================================================================
 # TTS CACHE
 # ============================================================================
 
+@functools.lru_cache(maxsize=512)
+def _cache_path(cache_dir, text, lang):
+    """Cache file path for (text, lang); memoized since one utterance looks it up several times"""
+    text_hash = hashlib.blake2b(f"{text}_{lang}".encode(), digest_size=16).hexdigest()
+    return os.path.join(cache_dir, f"{text_hash}.mp3")
+
 class TTSCache:
     """Manage TTS audio caching"""
     
-    def __init__(self, cache_dir, duration_days=7):
+    __slots__ = ('cache_dir', 'duration_days', 'sweep_interval',
+                 '_ttl_sec', '_mtimes', '_lock', '_stop', '_sweeper')
+    
+    def __init__(self, cache_dir, duration_days=7, sweep_interval=3600):
         self.cache_dir = os.path.expanduser(cache_dir)
         self.duration_days = duration_days
+        self._ttl_sec = duration_days * 86400
+        self.sweep_interval = sweep_interval
         os.makedirs(self.cache_dir, exist_ok=True)
+        
+        # {cache file path: mtime}, filled by one scandir on first use. The dict
+        # is only ever mutated in place, under _lock (save vs. the sweeper)
+        self._mtimes = None
+        self._lock = threading.RLock()
+        
+        # Expired files are deleted by a background sweeper, not on lookup
+        self._stop = threading.Event()
+        self._sweeper = threading.Thread(target=self._sweep_loop, daemon=True)
+        self._sweeper.start()
+    
+    def _sweep_loop(self):
+        """Run clear_old now and then every sweep_interval seconds"""
+        while not self._stop.is_set():
+            try:
+                self.clear_old()
+            except OSError as e:
+                logger.warning(f"TTS cache sweep failed: {e}")
+            self._stop.wait(self.sweep_interval)
+    
+    def close(self):
+        """Stop the background sweeper"""
+        self._stop.set()
+    
+    def _load_index(self):
+        """Stat every cached file once (caller holds _lock)"""
+        mtimes = {}
+        with os.scandir(self.cache_dir) as entries:
+            for entry in entries:
+                if entry.is_file(follow_symlinks=False):
+                    mtimes[entry.path] = entry.stat(follow_symlinks=False).st_mtime
+        self._mtimes = mtimes
+        return mtimes
+    
+    def _index(self):
+        """The mtime index, loading it if needed"""
+        mtimes = self._mtimes
+        if mtimes is None:
+            with self._lock:
+                mtimes = self._mtimes
+                if mtimes is None:
+                    mtimes = self._load_index()
+        return mtimes
+    
+    def _is_expired(self, mtime):
+        """Whether a file with this mtime is past the cache duration"""
+        return time.time() - mtime > self._ttl_sec
     
     def get_cache_path(self, text, lang='en'):
         """Get cache file path for given text"""
-        import hashlib
-        text_hash = hashlib.md5(f"{text}_{lang}".encode()).hexdigest()
-        return os.path.join(self.cache_dir, f"{text_hash}.mp3")
+        return _cache_path(self.cache_dir, text, lang)
     
     def exists(self, text, lang='en'):
         """Check if cached audio exists and is valid"""
         cache_path = self.get_cache_path(text, lang)
         
-        if not os.path.exists(cache_path):
+        mtime = self._index().get(cache_path)
+        if mtime is None:
             return False
         
-        # Check if cache is expired
-        file_time = datetime.fromtimestamp(os.path.getmtime(cache_path))
-        if datetime.now() - file_time > timedelta(days=self.duration_days):
-            os.remove(cache_path)
-            return False
-        
-        return True
+        # Expired files are left for the sweeper to delete
+        return not self._is_expired(mtime)
     
     def get(self, text, lang='en'):
         """Get cached audio file path"""
-        if self.exists(text, lang):
-            return self.get_cache_path(text, lang)
+        if not self.exists(text, lang):
+            return None
+        
+        # The index can outlive a file removed outside this process; confirm
+        # before handing out a path to play, and forget it if it is gone
+        cache_path = self.get_cache_path(text, lang)
+        if os.path.isfile(cache_path):
+            return cache_path
+        with self._lock:
+            self._index().pop(cache_path, None)
         return None
     
     def save(self, text, audio_file, lang='en'):
         """Save audio to cache"""
         cache_path = self.get_cache_path(text, lang)
-        import shutil
-        shutil.copy2(audio_file, cache_path)
+        with self._lock:
+            shutil.copy2(audio_file, cache_path)
+            self._index()[cache_path] = os.stat(cache_path).st_mtime
     
     def clear_old(self):
-        """Clear expired cache files"""
-        for filename in os.listdir(self.cache_dir):
-            filepath = os.path.join(self.cache_dir, filename)
-            file_time = datetime.fromtimestamp(os.path.getmtime(filepath))
+        """Clear expired cache files and refresh the index from disk"""
+        cutoff = time.time() - self._ttl_sec
+        with self._lock:
+            mtimes = self._mtimes if self._mtimes is not None else {}
+            on_disk = set()
+            with os.scandir(self.cache_dir) as entries:
+                for entry in entries:
+                    if not entry.is_file(follow_symlinks=False):
+                        continue
+                    mtime = entry.stat(follow_symlinks=False).st_mtime
+                    if mtime < cutoff:
+                        try:
+                            os.unlink(entry.path)
+                        except FileNotFoundError:
+                            pass
+                        mtimes.pop(entry.path, None)
+                    else:
+                        mtimes[entry.path] = mtime
+                        on_disk.add(entry.path)
             
-            if datetime.now() - file_time > timedelta(days=self.duration_days):
-                os.remove(filepath)
+            # Forget files removed behind our back
+            for path in [path for path in mtimes if path not in on_disk]:
+                del mtimes[path]
+            self._mtimes = mtimes
 
 # ============================================================================
 # HELPER FUNCTIONS
 # ============================================================================
 
+# Single-character replacements for sanitize_filename ('..' is handled separately)
+_SANITIZE_TABLE = str.maketrans({c: '_' for c in '/\\~$`|;&><*?"\''})
+
 def sanitize_filename(filename):
     """Sanitize filename to prevent path traversal"""
-    dangerous_chars = ['/', '\\', '..', '~', '$', '`', '|', ';', '&', '>', '<', '*', '?', '"', "'"]
-    sanitized = filename
-    
-    for char in dangerous_chars:
-        sanitized = sanitized.replace(char, '_')
-    
+    sanitized = filename.translate(_SANITIZE_TABLE).replace('..', '_')
     return sanitized[:255].strip()
 
+@functools.lru_cache(maxsize=256)
 def command_exists(command):
-    """Check if a command exists in PATH"""
-    try:
-        subprocess.run(['which', command], 
-                      capture_output=True, 
-                      check=True, 
-                      timeout=2)
-        return True
-    except:
-        return False
+    """Check if a command exists in PATH (cached; PATH doesn't change mid-session)"""
+    return shutil.which(command) is not None
@@ -4,14 +4,43 @@ Enables contextual command chains like:
   "Open Chrome" → "Profile 1" → "YouTube" → "Search X"
 """
 
+import functools
 import logging
 import time
 import subprocess
+import webbrowser
 from enum import Enum
+from types import MappingProxyType
+from urllib.parse import quote_plus
 from typing import Optional, Dict, Any, List
 
+from constants import WEBSITE_URLS
+
 logger = logging.getLogger(__name__)
 
+# Spoken profile names -> Chrome --profile-directory values
+_CHROME_PROFILE_MAP = MappingProxyType({
+    'default': 'Default',
+    'me': 'Default',
+    'profile 1': 'Profile 1',
+    'profile1': 'Profile 1',
+    '1': 'Profile 1',
+    'amaan': 'Profile 1',
+    'profile 2': 'Profile 2',
+    'profile2': 'Profile 2',
+    '2': 'Profile 2',
+    'work': 'Profile 2',
+})
+
+# Shared Popen options for detached browser launches: own session, no
+# inherited stdio, so browser chatter stays out of the assistant console
+_POPEN_KW = MappingProxyType({
+    'stdin': subprocess.DEVNULL,
+    'stdout': subprocess.DEVNULL,
+    'stderr': subprocess.DEVNULL,
+    'start_new_session': True,
+})
+
 class WorkflowState(Enum):
     """Current state of workflow"""
     IDLE = "idle"
@@ -22,19 +51,30 @@ class WorkflowState(Enum):
     VIDEO_PLAYING = "video_playing"
     APP_OPENING = "app_opening"
 
+# State -> value string, so logging and state reports skip the Enum descriptor
+_STATE_STR = {s: s.value for s in WorkflowState}
+
+@functools.lru_cache(maxsize=256)
+def _resolve_site(name: str) -> str:
+    """URL for a spoken site name, falling back to a Google search"""
+    return WEBSITE_URLS.get(name.lower()) or f"https://www.google.com/search?q={quote_plus(name)}"
+
 class Workflow:
     """Represents a multi-step workflow"""
     
+    __slots__ = ('name', 'steps', 'current_step', 'data', 'created_at', '_n')
+    
     def __init__(self, name: str, steps: List[str]):
         self.name = name
-        self.steps = steps
+        self.steps = tuple(steps)
+        self._n = len(self.steps)
         self.current_step = 0
         self.data = {}  # Store workflow data
         self.created_at = time.time()
     
     def next_step(self) -> Optional[str]:
         """Get next step in workflow"""
-        if self.current_step < len(self.steps):
+        if self.current_step < self._n:
             step = self.steps[self.current_step]
             self.current_step += 1
             return step
@@ -42,15 +82,19 @@ class Workflow:
     
     def is_complete(self) -> bool:
         """Check if workflow is complete"""
-        return self.current_step >= len(self.steps)
+        return self.current_step >= self._n
     
     def get_progress(self) -> str:
         """Get workflow progress"""
-        return f"{self.current_step}/{len(self.steps)}"
+        return f"{self.current_step}/{self._n}"
 
 class WorkflowManager:
     """Manages multi-step workflows and contextual commands"""
     
+    __slots__ = ('context', 'tab_manager', 'state', 'current_workflow',
+                 'waiting_for', 'browser_process', 'selected_profile',
+                 'current_url', 'state_started_at', 'state_timeout')
+    
     def __init__(self, context_manager, tab_manager):
         self.context = context_manager
         self.tab_manager = tab_manager
@@ -86,7 +130,7 @@ class WorkflowManager:
     
     def set_state(self, new_state: WorkflowState, waiting_for: str = None):
         """Change workflow state"""
-        logger.info(f"State: {self.state.value} → {new_state.value}")
+        logger.info(f"State: {_STATE_STR[self.state]} → {_STATE_STR[new_state]}")
         self.state = new_state
         self.waiting_for = waiting_for
         self.state_started_at = time.time()
@@ -100,7 +144,7 @@ class WorkflowManager:
     def get_current_state_info(self) -> Dict[str, Any]:
         """Get current state information"""
         return {
-            'state': self.state.value,
+            'state': _STATE_STR[self.state],
             'waiting_for': self.waiting_for,
             'workflow': self.current_workflow.name if self.current_workflow else None,
             'workflow_progress': self.current_workflow.get_progress() if self.current_workflow else None
@@ -125,16 +169,19 @@ class WorkflowManager:
             if profile:
                 # Open with specific profile
                 profile_dir = self._get_chrome_profile(profile)
-                cmd = f'google-chrome --profile-directory="{profile_dir}"'
+                cmd = ['google-chrome', f'--profile-directory={profile_dir}']
             else:
                 # Open normally, will show profile selector
-                cmd = 'google-chrome'
+                cmd = ['google-chrome']
             
             try:
-                self.browser_process = subprocess.Popen(cmd, shell=True)
+                known = self._list_windows()
+                self.browser_process = subprocess.Popen(cmd, **_POPEN_KW)
+                # New process: any earlier profile no longer describes it
+                self.selected_profile = None
                 
                 # Give browser time to start
-                time.sleep(2)
+                self._wait_for_window(self.browser_process, 'chrome', known)
                 
                 if profile:
                     # Profile specified, go directly to ready state
@@ -158,14 +205,55 @@ class WorkflowManager:
             # Other browsers (Firefox, etc.)
             cmd = browser_name.lower()
             try:
-                subprocess.Popen([cmd])
-                time.sleep(2)
+                known = self._list_windows()
+                process = subprocess.Popen([cmd], **_POPEN_KW)
+                self._wait_for_window(process, cmd, known)
                 self.set_state(WorkflowState.BROWSER_READY)
                 return True, f"{browser_name} opened"
-            except:
+            except OSError as e:
+                logger.error(f"Failed to open {browser_name}: {e}")
                 self.set_state(WorkflowState.IDLE)
                 return False, f"Failed to open {browser_name}"
     
+    def _list_windows(self) -> Optional[Dict[str, str]]:
+        """
+        Map of window ID -> lowercased title from wmctrl
+        Returns None when wmctrl is missing or does not answer
+        """
+        try:
+            result = subprocess.run(['wmctrl', '-l'], capture_output=True, text=True, timeout=0.5)
+        except (FileNotFoundError, subprocess.TimeoutExpired):
+            return None
+        
+        windows = {}
+        for line in result.stdout.splitlines():
+            # "<id> <desktop> <host> <title>"
+            parts = line.split(None, 3)
+            if parts:
+                windows[parts[0]] = parts[3].lower() if len(parts) > 3 else ''
+        return windows
+    
+    def _wait_for_window(self, process, hint: str, known: Optional[Dict[str, str]],
+                         timeout: float = 2.0, interval: float = 0.05) -> bool:
+        """
+        Wait until a window not in known (a _list_windows() snapshot taken
+        before launch) appears with hint in its title
+        Returns False on timeout or if process exits first; without a
+        snapshot (no wmctrl) just waits out the timeout
+        """
+        hint = hint.lower()
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            if process.poll() is not None:
+                return False
+            if known is not None:
+                windows = self._list_windows()
+                if windows and any(hint in title for wid, title in windows.items()
+                                   if wid not in known):
+                    return True
+            time.sleep(interval)
+        return False
+    
     def handle_profile_selection(self, profile_input: str) -> tuple[bool, str]:
         """
         Handle Chrome profile selection
@@ -178,40 +266,35 @@ class WorkflowManager:
         profile_input = profile_input.lower().strip()
         
         # Map common names to profile directories
-        profile_map = {
-            'default': 'Default',
-            'me': 'Default',
-            'profile 1': 'Profile 1',
-            'profile1': 'Profile 1',
-            '1': 'Profile 1',
-            'amaan': 'Profile 1',
-            'profile 2': 'Profile 2',
-            'profile2': 'Profile 2',
-            '2': 'Profile 2',
-            'work': 'Profile 2',
-        }
-        
-        profile_dir = profile_map.get(profile_input)
+        profile_dir = _CHROME_PROFILE_MAP.get(profile_input)
         
         if not profile_dir:
             return False, f"Unknown profile: {profile_input}. Try 'Profile 1', 'Amaan', or 'Profile 2'"
         
+        # Same profile and Chrome still running: skip the close/relaunch cycle
+        if (self.selected_profile
+                and self._get_chrome_profile(self.selected_profile) == profile_dir
+                and self.browser_process and self.browser_process.poll() is None):
+            self.set_state(WorkflowState.BROWSER_READY)
+            return True, f"Already on {profile_input} profile. What would you like to do?"
+        
         # Close current Chrome instance
         if self.browser_process:
             try:
                 self.browser_process.terminate()
                 time.sleep(0.5)
-            except:
+            except OSError:
                 pass
         
         # Open with selected profile using pyautogui to click
         # First, let's try command line
-        cmd = f'google-chrome --profile-directory="{profile_dir}"'
+        cmd = ['google-chrome', f'--profile-directory={profile_dir}']
         
         try:
-            self.browser_process = subprocess.Popen(cmd, shell=True)
+            known = self._list_windows()
+            self.browser_process = subprocess.Popen(cmd, **_POPEN_KW)
             self.selected_profile = profile_input
-            time.sleep(2)
+            self._wait_for_window(self.browser_process, 'chrome', known)
             
             self.set_state(WorkflowState.BROWSER_READY)
             
@@ -224,19 +307,7 @@ class WorkflowManager:
     
     def _get_chrome_profile(self, profile_name: str) -> str:
         """Get Chrome profile directory name"""
-        profile_map = {
-            'default': 'Default',
-            'me': 'Default',
-            'profile 1': 'Profile 1',
-            'profile1': 'Profile 1',
-            '1': 'Profile 1',
-            'amaan': 'Profile 1',
-            'profile 2': 'Profile 2',
-            'profile2': 'Profile 2',
-            '2': 'Profile 2',
-            'work': 'Profile 2',
-        }
-        return profile_map.get(profile_name.lower(), 'Default')
+        return _CHROME_PROFILE_MAP.get(profile_name.lower().strip(), 'Default')
     
     def handle_website_opening(self, website_name: str) -> tuple[bool, str]:
         """
@@ -248,17 +319,10 @@ class WorkflowManager:
             if not self.tab_manager or not self.tab_manager.get_all_tabs():
                 return False, "No browser is open. Say 'Open Chrome' first"
         
-        # Get URL for website
-        from constants import WEBSITE_URLS
-        
-        url = WEBSITE_URLS.get(website_name.lower())
-        
-        if not url:
-            # Try generic search
-            url = f"https://www.google.com/search?q={website_name}"
+        # Known site URL, or a Google search for anything else
+        url = _resolve_site(website_name)
         
         # Open URL
-        import webbrowser
         webbrowser.open(url)
         
         self.current_url = url
@@ -275,20 +339,20 @@ class WorkflowManager:
             if self.tab_manager:
                 tabs = self.tab_manager.get_all_tabs()
                 for tab in tabs:
-                    if 'youtube' in tab['title'].lower():
+                    title_lower = tab['title_lower']
+                    if 'youtube' in title_lower:
                         platform = 'youtube'
                         break
-                    elif 'google' in tab['title'].lower():
+                    elif 'google' in title_lower:
                         platform = 'google'
                         break
         
         if platform == 'youtube':
-            url = f"https://www.youtube.com/results?search_query={query.replace(' ', '+')}"
+            url = f"https://www.youtube.com/results?search_query={quote_plus(query)}"
         else:
             # Default to Google
-            url = f"https://www.google.com/search?q={query.replace(' ', '+')}"
+            url = f"https://www.google.com/search?q={quote_plus(query)}"
         
-        import webbrowser
         webbrowser.open(url)
         
         return True, f"Searching for {query}"
@@ -307,4 +371,4 @@ class WorkflowManager:
         elif self.state == WorkflowState.SEARCHING:
             return "On search page. Say: 'Play first video', 'Next page'"
         
-        return f"Current state: {self.state.value}"
+        return f"Current state: {_STATE_STR[self.state]}"